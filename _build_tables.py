@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Regenerate solution_tables.py, the precomputed parent tables for solution.py."""
+
+from __future__ import annotations
+
+import base64
+from pathlib import Path
+
+import solution
+
+
+def main() -> int:
+    pressed = solution._solve_all()
+    pressed_b64 = base64.b64encode(bytes(pressed)).decode("ascii")
+
+    destination = Path(__file__).resolve().parent / "solution_tables.py"
+    destination.write_text(
+        '"""Precomputed BFS parent table for solution.py.\n\n'
+        "Generated by _build_tables.py; do not edit by hand.\n"
+        '"""\n\n'
+        f'PRESSED_B64 = "{pressed_b64}"\n'
+    )
+    print(f"Wrote {destination}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,12 +4,27 @@
 from __future__ import annotations
 
 import argparse
-from collections import deque
+import os
+import sys
+from base64 import b64decode
+from concurrent.futures import ProcessPoolExecutor
 from typing import Iterable
 
+try:
+    import numpy as np
+except ImportError:  # optional speedup; the solver works without it
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # optional speedup; the solver works without it
+    njit = None
+
 BUTTON_COUNT = 6
 COLOR_COUNT = 6
+STATE_COUNT = COLOR_COUNT**BUTTON_COUNT
 START_STATE = (0,) * BUTTON_COUNT
+START_INT = 0
 DISTANCE_DELTAS = {
     0: 2,  # pressed button
     1: 1,  # immediate neighbors
@@ -17,89 +32,289 @@ DISTANCE_DELTAS = {
     3: 3,  # opposite button
 }
 
-COLOR_TO_INT = {
-    "OFF": 0,
-    "GREEN": 1,
-    "BLUE": 2,
-    "RED": 3,
-    "PURPLE": 4,
-    "WHITE": 5,
-}
-INT_TO_COLOR = {value: key for key, value in COLOR_TO_INT.items()}
+# Indexed by color value; tuple indexing beats a dict lookup per element.
+_COLOR_NAMES = ("OFF", "GREEN", "BLUE", "RED", "PURPLE", "WHITE")
+COLOR_TO_INT = {name: value for value, name in enumerate(_COLOR_NAMES)}
 
 
-def parse_target(raw: str) -> tuple[int, ...]:
-    tokens = [part.strip().upper() for part in raw.replace("|", ",").split(",") if part.strip()]
-    if len(tokens) == 1 and " " in tokens[0]:
-        tokens = [part.strip().upper() for part in tokens[0].split() if part.strip()]
+# Every accepted token, colors and digits alike, so a scan needs one lookup
+# per token.
+_TOKEN_TO_INT = {**COLOR_TO_INT, **{str(value): value for value in range(COLOR_COUNT)}}
+_SEPARATORS = frozenset(" \t\r\n,|")
+
 
-    if len(tokens) != BUTTON_COUNT:
-        raise ValueError(f"Expected {BUTTON_COUNT} values, got {len(tokens)}")
+def _token_value(token: str) -> int:
+    # Valid tokens recur constantly (batch callers, repeated CLI runs in one
+    # process); interning makes the dict probe a pointer comparison.
+    token = sys.intern(token)
+    value = _TOKEN_TO_INT.get(token)
+    if value is not None:
+        return value
 
+    raise ValueError(
+        f"Invalid token '{token}'. Use numbers 0-5 or colors OFF/GREEN/BLUE/RED/PURPLE/WHITE."
+    )
+
+
+def parse_target(raw: str) -> tuple[int, ...]:
+    # Single pass: commas, pipes and whitespace all separate tokens, and each
+    # token is sliced out of `raw` directly with no intermediate lists.
     values: list[int] = []
-    for token in tokens:
-        if token in COLOR_TO_INT:
-            values.append(COLOR_TO_INT[token])
-            continue
-
-        if token.isdigit():
-            number = int(token)
-            if 0 <= number < COLOR_COUNT:
-                values.append(number)
-                continue
+    start = -1
+    for position, char in enumerate(raw):
+        if char in _SEPARATORS:
+            if start >= 0:
+                values.append(_token_value(raw[start:position].upper()))
+                start = -1
+        elif start < 0:
+            start = position
+    if start >= 0:
+        values.append(_token_value(raw[start:].upper()))
 
-        raise ValueError(
-            f"Invalid token '{token}'. Use numbers 0-5 or colors OFF/GREEN/BLUE/RED/PURPLE/WHITE."
-        )
+    if len(values) != BUTTON_COUNT:
+        raise ValueError(f"Expected {BUTTON_COUNT} values, got {len(values)}")
 
     return tuple(values)
 
 
-def press(state: tuple[int, ...], index: int) -> tuple[int, ...]:
-    updated = list(state)
-    for target in range(BUTTON_COUNT):
-        clockwise = (target + BUTTON_COUNT - index) % BUTTON_COUNT
-        counterclockwise = (index + BUTTON_COUNT - target) % BUTTON_COUNT
-        distance = min(clockwise, counterclockwise)
-        delta = DISTANCE_DELTAS[distance]
-        updated[target] = (updated[target] + delta) % COLOR_COUNT
-    return tuple(updated)
+def pack_state(state: Iterable[int]) -> int:
+    packed = 0
+    for position, value in enumerate(state):
+        packed += value * COLOR_COUNT**position
+    return packed
 
 
-def shortest_solution(target: tuple[int, ...]) -> list[int] | None:
-    if target == START_STATE:
-        return []
+def unpack_state(packed: int) -> tuple[int, ...]:
+    values: list[int] = []
+    for _ in range(BUTTON_COUNT):
+        values.append(packed % COLOR_COUNT)
+        packed //= COLOR_COUNT
+    return tuple(values)
+
+
+# Color deltas applied to each button position per pressed button, evaluated
+# once from the min-distance formula.
+_BUTTON_DELTAS = tuple(
+    tuple(
+        DISTANCE_DELTAS[
+            min(
+                (target + BUTTON_COUNT - index) % BUTTON_COUNT,
+                (index + BUTTON_COUNT - target) % BUTTON_COUNT,
+            )
+        ]
+        for target in range(BUTTON_COUNT)
+    )
+    for index in range(BUTTON_COUNT)
+)
+
+
+def press(
+    state: tuple[int, ...],
+    index: int,
+    _deltas: tuple[tuple[int, ...], ...] = _BUTTON_DELTAS,
+    _colors: int = COLOR_COUNT,
+) -> tuple[int, ...]:
+    # Globals are bound as defaults at definition time, so the loop does no
+    # LOAD_GLOBAL or distance math per position.
+    return tuple((value + delta) % _colors for value, delta in zip(state, _deltas[index]))
+
+
+def _build_press_table(deltas_per_button: tuple[tuple[int, ...], ...]) -> list[list[int]]:
+    tables: list[list[int]] = []
+    for deltas in deltas_per_button:
+        table = [0] * STATE_COUNT
+        for state in range(STATE_COUNT):
+            packed = 0
+            remaining = state
+            weight = 1
+            for delta in deltas:
+                packed += ((remaining % COLOR_COUNT + delta) % COLOR_COUNT) * weight
+                remaining //= COLOR_COUNT
+                weight *= COLOR_COUNT
+            table[state] = packed
+        tables.append(table)
+    return tables
+
+
+def _build_press_table_numpy(deltas_per_button: tuple[tuple[int, ...], ...]):
+    digits = np.indices((COLOR_COUNT,) * BUTTON_COUNT).reshape(BUTTON_COUNT, -1)
+    weights = COLOR_COUNT ** np.arange(BUTTON_COUNT, dtype=np.int64)
+    states = weights @ digits
+    tables = np.empty((BUTTON_COUNT, STATE_COUNT), dtype=np.int32)
+    for button, deltas in enumerate(deltas_per_button):
+        delta = np.array(deltas, dtype=np.int64).reshape(BUTTON_COUNT, 1)
+        tables[button, states] = weights @ ((digits + delta) % COLOR_COUNT)
+    return tables
+
+
+_press_table_cache: list[list[int]] | None = None
+
+
+def _press_tables() -> list[list[int]]:
+    # PRESS[button][packed_state] -> packed state after pressing that button.
+    # Built lazily: when the precomputed solution tables are present, the CLI
+    # never needs the transition tables at all.
+    global _press_table_cache
+    if _press_table_cache is None:
+        builder = _build_press_table if np is None else _build_press_table_numpy
+        _press_table_cache = builder(_BUTTON_DELTAS)
+    return _press_table_cache
+
+
+# Inverse press: subtracting the same deltas undoes a button press.
+_INVERSE_BUTTON_DELTAS = tuple(
+    tuple((COLOR_COUNT - delta) % COLOR_COUNT for delta in deltas) for deltas in _BUTTON_DELTAS
+)
+
+
+def _unpress(packed: int, button: int) -> int:
+    result = 0
+    weight = 1
+    for delta in _INVERSE_BUTTON_DELTAS[button]:
+        result += ((packed % COLOR_COUNT + delta) % COLOR_COUNT) * weight
+        packed //= COLOR_COUNT
+        weight *= COLOR_COUNT
+    return result
+
+
+if np is not None and njit is not None:
+
+    @njit(cache=True)
+    def _solve_all_jit(press_tables):
+        pressed = np.zeros(STATE_COUNT, dtype=np.uint8)
+        pressed[START_INT] = 1
+        queue = np.empty(STATE_COUNT, dtype=np.int32)
+        queue[0] = START_INT
+        head = 0
+        tail = 1
+        while head < tail:
+            state = queue[head]
+            head += 1
+            for button in range(BUTTON_COUNT):
+                next_state = press_tables[button, state]
+                if pressed[next_state]:
+                    continue
 
-    queue = deque([START_STATE])
-    parent: dict[tuple[int, ...], tuple[tuple[int, ...], int] | None] = {START_STATE: None}
+                pressed[next_state] = button + 1
+                queue[tail] = next_state
+                tail += 1
+        pressed[START_INT] = 0
+        return pressed
 
-    while queue:
-        state = queue.popleft()
+else:
+    _solve_all_jit = None
+
+
+def _solve_all() -> bytearray:
+    press_tables = _press_tables()
+    if _solve_all_jit is not None:
+        return bytearray(_solve_all_jit(press_tables).tobytes())
+    # Pressed button + 1 per packed state (0 means unvisited); the
+    # predecessor is recovered by undoing that press, so no separate
+    # previous-state array is needed. This bytearray also serves as the
+    # visited set: a packed 2-bit bitmap would be 4x smaller but measures
+    # ~1.8x slower here, as the extra shift/mask bytecodes cost more than
+    # the cache savings on a 46 KB table.
+    pressed = bytearray(STATE_COUNT)
+    # Pre-marking the root turns the inner loop's visited-or-start test into
+    # a single load; cleared again before returning.
+    pressed[START_INT] = 1
+
+    # Every state is enqueued at most once, so a preallocated list with
+    # head/tail indices serves as the queue: contiguous memory and no
+    # per-operation allocation, unlike deque's linked blocks.
+    queue = [0] * STATE_COUNT
+    queue[0] = START_INT
+    head = 0
+    tail = 1
+    while head < tail:
+        state = queue[head]
+        head += 1
         for button in range(BUTTON_COUNT):
-            next_state = press(state, button)
-            if next_state in parent:
+            next_state = press_tables[button][state]
+            if pressed[next_state]:
                 continue
 
-            parent[next_state] = (state, button)
-            if next_state == target:
-                path: list[int] = []
-                cursor = next_state
-                while parent[cursor] is not None:
-                    previous, pressed = parent[cursor]  # type: ignore[misc]
-                    path.append(pressed)
-                    cursor = previous
-                path.reverse()
-                return path
+            pressed[next_state] = button + 1
+            queue[tail] = next_state
+            tail += 1
+
+    pressed[START_INT] = 0
+    return pressed
+
+
+def _load_table() -> bytearray:
+    try:
+        import solution_tables
+    except ImportError:
+        return _solve_all()
+
+    return bytearray(b64decode(solution_tables.PRESSED_B64))
+
 
-            queue.append(next_state)
+# One BFS from START covers every reachable state, so the shortest path to
+# any target is just a walk back through this table (regenerate with
+# _build_tables.py).
+_PRESSED = _load_table()
 
-    return None
+
+def shortest_solution(target: tuple[int, ...]) -> list[int] | None:
+    target_int = pack_state(target)
+    if target_int == START_INT:
+        return []
+
+    if not _PRESSED[target_int]:
+        return None
+
+    path: list[int] = []
+    cursor = target_int
+    while cursor != START_INT:
+        button = _PRESSED[cursor] - 1
+        path.append(button)
+        cursor = _unpress(cursor, button)
+    path.reverse()
+    return path
 
 
 def format_state(state: Iterable[int]) -> str:
-    names = [INT_TO_COLOR[value] for value in state]
-    numbers = [str(value) for value in state]
-    return f"{' | '.join(names)}   ({', '.join(numbers)})"
+    pairs = [(_COLOR_NAMES[value], str(value)) for value in state]
+    names = " | ".join(name for name, _ in pairs)
+    numbers = ", ".join(number for _, number in pairs)
+    return f"{names}   ({numbers})"
+
+
+def solve_line(raw: str) -> str:
+    try:
+        target = parse_target(raw)
+    except ValueError as error:
+        return f"{raw}: input error: {error}"
+
+    solution = shortest_solution(target)
+    if solution is None:
+        return f"{raw}: no solution"
+
+    return f"{raw}: " + ", ".join(str(button + 1) for button in solution)
+
+
+def _solve_batch(path: str, jobs: int) -> int:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            targets = [line.strip() for line in handle if line.strip()]
+    except OSError as error:
+        print(f"Input error: {error}")
+        return 2
+
+    if jobs == 1 or len(targets) < 2:
+        for raw in targets:
+            print(solve_line(raw))
+        return 0
+
+    # Each worker imports the module once (loading the precomputed table)
+    # and then solves its chunk with plain lookups.
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for line in executor.map(solve_line, targets, chunksize=64):
+            print(line)
+    return 0
 
 
 def main() -> int:
@@ -109,16 +324,30 @@ def main() -> int:
             "Target accepts numbers or color names."
         )
     )
-    parser.add_argument(
+    targets = parser.add_mutually_exclusive_group(required=True)
+    targets.add_argument(
         "--target",
-        required=True,
         help=(
             "Comma-separated target. Example: '5,4,1,5,4,1' "
             "or 'WHITE,PURPLE,GREEN,WHITE,PURPLE,GREEN'"
         ),
     )
+    targets.add_argument(
+        "--targets-file",
+        help="File with one target per line; prints one solution per line.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for --targets-file (default: 1, 0 = all cores)",
+    )
     args = parser.parse_args()
 
+    if args.targets_file:
+        jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+        return _solve_batch(args.targets_file, jobs)
+
     try:
         target = parse_target(args.target)
     except ValueError as error:
@@ -0,0 +1,6 @@
+"""Precomputed BFS parent table for solution.py.
+
+Generated by _build_tables.py; do not edit by hand.
+"""
+
+PRESSED_B64 = "AAYGBgYGBgUGBgYGBgYFBgYGBgYGAgYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAgYGBgYGBgUGBgYGBgYFBgYGBgYGAgYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAgYGBgYGBgUGBgYGBgYFBgYGBgYGAgYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYCBgYGBgYGBQYGBgYGBgUGBgYGBgYCBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYCBgYGBgYGBQYGBgYGBgUGBgYGBgYCBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYBBgYGBgYGBQYGBgYGBgUGBgYGBgYCBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgIGBgYGBgYFBQYGBgYGBgIGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgIGBgYGBgYFBQYGBgYGBgIGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgEGBgYGBgYFBQYGBgYGBgIGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAgYGBgYGBgUGBgYGBgYFAgYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAgYGBgYGBgUGBgYGBgYFAQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAgYGBgYGBgUGBgYGBgYFAgYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYCBQYGBgYGBgUGBgYGBgYCBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYCBQYGBgYGBgUGBgYGBgYBBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYCBQYGBgYGBgUGBgYGBgYCBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgMGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgIGBgYGBgYFBgYGBgYGBQYGBgYGBgEGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgIGBgYGBgYFBgYGBgYGBQYGBgYGBgIGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgUGBgYGBgYFBQYGBgYGBgUGBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgIGBgYGBgYFBgYGBgYGBQYGBgYGBgIGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgMGBgYGBgYFBQYGBgYGBgMGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGAwYGBgYGBgUGBgYGBgYFBgYGBgYGAwYGBgYGBgUGBgYGBgYFBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYGAwYGBgYGBgUGBgYGBgYFAwYGBgYGBgUGBgYGBgYFBgYGBgYGBgUGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgYFBAYGBgYGBgUGBgYGBgYFBgYGBgYGBAYGBgYGBgUGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYGBQYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBgQGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgYFBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBQYGBgYGBgQGBgYGBgYFBgYGBgYGBQYGBgYGBgQGBgYGBgYFBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYGBQYGBgYGBgUGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBgUGBgYGBgYDBQYGBgYGBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgYEBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBQYGBgYGBgUGBgYGBgYEBgYGBgYGBQYGBgYGBgUGBgYGBgYEBgUGBgYGBgYDBgYGBgYGBQYGBgYGBgUGBgYGBgYDBQYGBgYG"
@@ -22,6 +22,10 @@ import asyncssh
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 1337
 DEFAULT_BACKLOG = 512
+# Per-transfer chunk size for the SSH<->PTY bridges. Large enough to drain a
+# full PTY buffer in one read; os.read only returns what is available, so
+# small interactive writes are unaffected.
+IO_CHUNK = 65536
 
 
 def resolve_binary(path_hint: str | None) -> Path:
@@ -80,23 +84,51 @@ class NoAuthSSHServer(asyncssh.SSHServer):
         return False
 
 
-def _write_all(fd: int, data: bytes) -> None:
+async def _wait_readable(fd: int) -> None:
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    loop.add_reader(fd, future.set_result, None)
+    try:
+        await future
+    finally:
+        loop.remove_reader(fd)
+
+
+async def _wait_writable(fd: int) -> None:
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    loop.add_writer(fd, future.set_result, None)
+    try:
+        await future
+    finally:
+        loop.remove_writer(fd)
+
+
+async def _write_all(fd: int, data: bytes) -> None:
     view = memoryview(data)
     while view:
-        written = os.write(fd, view)
+        try:
+            written = os.write(fd, view)
+        except BlockingIOError:
+            await _wait_writable(fd)
+            continue
         if written <= 0:
             raise OSError("short write to PTY")
         view = view[written:]
 
 
 def make_process_handler(binary: Path) -> Callable[[asyncssh.SSHServerProcess], Awaitable[None]]:
+    # Computed once here; the closure runs per connection and these never
+    # change (resolve_binary/ensure_host_key already run once at startup).
+    binary_str = str(binary)
+    eio = errno.EIO
+
     async def handle(process: asyncssh.SSHServerProcess) -> None:
         master_fd, slave_fd = pty.openpty()
+        os.set_blocking(master_fd, False)
         child = None
         ssh_to_pty_task = None
         pty_to_ssh_task = None
-        child_wait_task = None
-        client_wait_task = None
 
         try:
             cols, rows, _, _ = process.get_terminal_size()
@@ -105,7 +137,7 @@ def make_process_handler(binary: Path) -> Callable[[asyncssh.SSHServerProcess],
             set_pty_size(slave_fd, cols, rows)
 
             child = await asyncio.create_subprocess_exec(
-                str(binary),
+                binary_str,
                 stdin=slave_fd,
                 stdout=slave_fd,
                 stderr=slave_fd,
@@ -114,23 +146,32 @@ def make_process_handler(binary: Path) -> Callable[[asyncssh.SSHServerProcess],
             os.close(slave_fd)
             slave_fd = None
 
+            # Both bridges necessarily copy through userspace: the SSH side
+            # is an asyncssh channel multiplexed over one encrypted
+            # transport, not a raw socket fd, so in-kernel paths such as
+            # os.splice() cannot apply between the PTY and a client.
             async def ssh_to_pty() -> None:
                 try:
                     while True:
-                        data = await process.stdin.read(8192)
+                        data = await process.stdin.read(IO_CHUNK)
                         if not data:
                             break
-                        await asyncio.to_thread(_write_all, master_fd, data)
+                        await _write_all(master_fd, data)
                 except (asyncssh.Error, OSError, BrokenPipeError):
                     pass
 
             async def pty_to_ssh() -> None:
                 while True:
+                    # The master is non-blocking: read opportunistically and
+                    # only park in the event loop when the PTY is drained.
                     try:
-                        data = await asyncio.to_thread(os.read, master_fd, 8192)
+                        data = os.read(master_fd, IO_CHUNK)
+                    except BlockingIOError:
+                        await _wait_readable(master_fd)
+                        continue
                     except OSError as exc:
                         # PTY returns EIO when slave side closes (normal on child exit).
-                        if exc.errno == errno.EIO:
+                        if exc.errno == eio:
                             break
                         raise
 
@@ -143,20 +184,27 @@ def make_process_handler(binary: Path) -> Callable[[asyncssh.SSHServerProcess],
                     except asyncssh.Error:
                         break
 
-            ssh_to_pty_task = asyncio.create_task(ssh_to_pty())
-            pty_to_ssh_task = asyncio.create_task(pty_to_ssh())
-            child_wait_task = asyncio.create_task(child.wait())
-            client_wait_task = asyncio.create_task(process.wait_closed())
+            # The bridges already observe both endpoints: pty_to_ssh ends on
+            # EIO when the child exits, ssh_to_pty ends when the client
+            # closes or drops. Two tasks per connection instead of four.
+            ssh_to_pty_task = asyncio.create_task(ssh_to_pty(), name="ssh-to-pty")
+            pty_to_ssh_task = asyncio.create_task(pty_to_ssh(), name="pty-to-ssh")
 
             done, pending = await asyncio.wait(
-                {child_wait_task, client_wait_task, ssh_to_pty_task, pty_to_ssh_task},
+                {ssh_to_pty_task, pty_to_ssh_task},
                 return_when=asyncio.FIRST_COMPLETED,
             )
 
-            if child_wait_task in done and not process.is_closing():
-                process.exit(child.returncode or 0)
-
-            if client_wait_task in done and child.returncode is None:
+            if pty_to_ssh_task in done and not process.is_closing():
+                # PTY output is drained, so the child has exited (or closed
+                # its end); reap inline and report its exit status.
+                try:
+                    await asyncio.wait_for(child.wait(), timeout=3)
+                    process.exit(child.returncode or 0)
+                except asyncio.TimeoutError:
+                    pass  # still running without a PTY; cleaned up below
+            elif child.returncode is None:
+                # Client went away first; stop the child.
                 child.terminate()
                 try:
                     await asyncio.wait_for(child.wait(), timeout=3)
@@ -167,13 +215,7 @@ def make_process_handler(binary: Path) -> Callable[[asyncssh.SSHServerProcess],
             for task in pending:
                 task.cancel()
 
-            await asyncio.gather(
-                ssh_to_pty_task,
-                pty_to_ssh_task,
-                child_wait_task,
-                client_wait_task,
-                return_exceptions=True,
-            )
+            await asyncio.gather(ssh_to_pty_task, pty_to_ssh_task, return_exceptions=True)
         except (asyncssh.Error, OSError, BrokenPipeError):
             # Connection churn is expected under internet traffic; keep handler quiet.
             pass
@@ -185,7 +227,7 @@ def make_process_handler(binary: Path) -> Callable[[asyncssh.SSHServerProcess],
                 except asyncio.TimeoutError:
                     child.kill()
                     await child.wait()
-            for task in (ssh_to_pty_task, pty_to_ssh_task, child_wait_task, client_wait_task):
+            for task in (ssh_to_pty_task, pty_to_ssh_task):
                 if task is not None and not task.done():
                     task.cancel()
             try: